@@ -9,9 +9,10 @@ Included in this file you will find:
 
 """
 from __future__ import print_function, unicode_literals
-import collections
 import re
+import itertools
 import keyword
+import weakref
 # from .helperfuncs import _currently_in_ipython
 from .pyrtlexceptions import PyrtlError, PyrtlInternalError
 
@@ -22,7 +23,7 @@ from .pyrtlexceptions import PyrtlError, PyrtlInternalError
 #   |__) |___ \__/ \__, |  \
 #
 
-class LogicNet(collections.namedtuple('LogicNet', ['op', 'op_param', 'args', 'dests'])):
+class LogicNet(object):
     """ The basic immutable datatype for storing a "net" in a netlist.
 
     This is used for the Internal representation that Python stores
@@ -71,8 +72,28 @@ class LogicNet(collections.namedtuple('LogicNet', ['op', 'op_param', 'args', 'de
         ('@', (memid, mem), (addr, data, wr_en), ()) => write data to mem (w/ id memid) at
                                                         address addr; req. write enable (wr_en)
 
+    LogicNets are hashed on their fields and stored in sets, so they should never
+    be modified once created (build a new LogicNet instead).
     """
 
+    # a plain slotted class rather than a namedtuple: nets are created by the
+    # million during elaboration and only ever accessed by field name
+    __slots__ = ('op', 'op_param', 'args', 'dests')
+
+    def __init__(self, op, op_param, args, dests):
+        self.op = op
+        self.op_param = op_param
+        self.args = args
+        self.dests = dests
+
+    def __iter__(self):
+        """ Iterate over (op, op_param, args, dests), allowing nets to be unpacked. """
+        return iter((self.op, self.op_param, self.args, self.dests))
+
+    def __repr__(self):
+        return 'LogicNet(op=%r, op_param=%r, args=%r, dests=%r)' % (
+            self.op, self.op_param, self.args, self.dests)
+
     def __str__(self):
         rhs = ', '.join(str(x) for x in self.args)
         lhs = ', '.join(str(x) for x in self.dests)
@@ -139,8 +160,7 @@ class LogicNet(collections.namedtuple('LogicNet', ['op', 'op_param', 'args', 'de
                 raise PyrtlInternalError('error, unknown op "%s"' % str(self.op))
 
     def __hash__(self):
-        # it seems that namedtuple is not always hashable
-        return hash(tuple(self))
+        return hash((self.op, self.op_param, self.args, self.dests))
 
     def __eq__(self, other):
         # We can't be going and calling __eq__ recursively on the logic nets for all of
@@ -256,12 +276,13 @@ class Block(object):
 
     def __init__(self):
         """Creates an empty hardware block."""
-        self.logic = set()  # set of nets, each is a LogicNet named tuple
+        self.logic = set()  # set of nets, each is a LogicNet
         self.wirevector_set = set()  # set of all wirevectors
         self.wirevector_by_name = {}  # map from name->wirevector, used for performance
         # pre-synthesis wirevectors to post-synthesis vectors
         self.legal_ops = set('w~&|^n+-*<>=xcsrm@')  # set of legal OPS
         self.rtl_assert_dict = {}   # map from wirevectors -> exceptions, used by rtl_assert
+        self._const_intern = weakref.WeakValueDictionary()  # map from const args -> Const
 
     def __str__(self):
         """String form has one LogicNet per line."""
@@ -541,7 +562,7 @@ class Block(object):
 
     def sanity_check_wirevector(self, w):
         """ Check that w is a valid wirevector type. """
-        from .wire import WireVector
+        WireVector = _net_check_types()[0]
         if not isinstance(w, WireVector):
             raise PyrtlError(
                 'error attempting to pass an input of type "%s" '
@@ -549,8 +570,7 @@ class Block(object):
 
     def sanity_check_net(self, net):
         """ Check that net is a valid LogicNet. """
-        from .wire import Input, Output, Const
-        from .memory import _MemReadBase
+        WireVector, Const, _MemReadBase = _net_check_types()
 
         # general sanity checks that apply to all operations
         if not isinstance(net, LogicNet):
@@ -560,7 +580,8 @@ class Block(object):
         if not isinstance(net.dests, tuple):
             raise PyrtlInternalError('error, LogicNet dests must be tuple')
         for w in net.args + net.dests:
-            self.sanity_check_wirevector(w)
+            if not isinstance(w, WireVector):
+                self.sanity_check_wirevector(w)  # raises the proper error
             if w._block is not self:
                 raise PyrtlInternalError('error, net references different block')
             if w not in self.wirevector_set:
@@ -578,37 +599,38 @@ class Block(object):
             # if isinstance(w, Output):
                 # raise PyrtlInternalError('error, Outputs cannot be arguments for a net')
 
-        if net.op not in self.legal_ops:
+        op = net.op
+        if op not in self.legal_ops:
             raise PyrtlInternalError('error, net op "%s" not from acceptable set %s' %
                                      (net.op, self.legal_ops))
 
         # operation specific checks on arguments
-        if net.op in 'w~rsm' and len(net.args) != 1:
+        if op in _unary_ops and len(net.args) != 1:
             raise PyrtlInternalError('error, op only allowed 1 argument')
-        if net.op in '&|^n+-*<>=' and len(net.args) != 2:
+        if op in _binary_ops and len(net.args) != 2:
             raise PyrtlInternalError('error, op only allowed 2 arguments')
-        if net.op == 'x':
+        if op == 'x':
             if len(net.args) != 3:
                 raise PyrtlInternalError('error, op only allowed 3 arguments')
             if net.args[1].bitwidth != net.args[2].bitwidth:
                 raise PyrtlInternalError('error, args have mismatched bitwidths')
             if net.args[0].bitwidth != 1:
                 raise PyrtlInternalError('error, mux select must be a single bit')
-        if net.op == '@' and len(net.args) != 3:
+        if op == '@' and len(net.args) != 3:
             raise PyrtlInternalError('error, op only allowed 3 arguments')
-        if net.op in '&|^n+-*<>=' and net.args[0].bitwidth != net.args[1].bitwidth:
+        if op in _binary_ops and net.args[0].bitwidth != net.args[1].bitwidth:
             raise PyrtlInternalError('error, args have mismatched bitwidths')
-        if net.op in 'm@' and net.args[0].bitwidth != net.op_param[1].addrwidth:
+        if op in _mem_ops and net.args[0].bitwidth != net.op_param[1].addrwidth:
             raise PyrtlInternalError('error, mem addrwidth mismatch')
-        if net.op == '@' and net.args[1].bitwidth != net.op_param[1].bitwidth:
+        if op == '@' and net.args[1].bitwidth != net.op_param[1].bitwidth:
             raise PyrtlInternalError('error, mem bitwidth mismatch')
-        if net.op == '@' and net.args[2].bitwidth != 1:
+        if op == '@' and net.args[2].bitwidth != 1:
             raise PyrtlInternalError('error, mem write enable must be 1 bit')
 
         # operation specific checks on op_params
-        if net.op in 'w~&|^n+-*<>=xcr' and net.op_param is not None:
+        if op in _no_param_ops and net.op_param is not None:
             raise PyrtlInternalError('error, op_param should be None')
-        if net.op == 's':
+        if op == 's':
             if not isinstance(net.op_param, tuple):
                 raise PyrtlInternalError('error, select op requires tuple op_param')
             for p in net.op_param:
@@ -616,7 +638,7 @@ class Block(object):
                     raise PyrtlInternalError('error, select op_param requires ints')
                 if p < 0 or p >= net.args[0].bitwidth:
                     raise PyrtlInternalError('error, op_param out of bounds')
-        if net.op in 'm@':
+        if op in _mem_ops:
             if not isinstance(net.op_param, tuple):
                 raise PyrtlInternalError('error, mem op requires tuple op_param')
             if len(net.op_param) != 2:
@@ -627,26 +649,54 @@ class Block(object):
                 raise PyrtlInternalError('error, mem op requires second operand of a memory type')
 
         # check destination validity
-        if net.op in 'w~&|^nr' and net.dests[0].bitwidth > net.args[0].bitwidth:
+        if op in _bitwise_ops and net.dests[0].bitwidth > net.args[0].bitwidth:
             raise PyrtlInternalError('error, upper bits of destination unassigned')
-        if net.op in '<>=' and net.dests[0].bitwidth != 1:
+        if op in _compare_ops and net.dests[0].bitwidth != 1:
             raise PyrtlInternalError('error, destination should be of bitwidth=1')
-        if net.op in '+-' and net.dests[0].bitwidth > net.args[0].bitwidth + 1:
+        if op in _addsub_ops and net.dests[0].bitwidth > net.args[0].bitwidth + 1:
             raise PyrtlInternalError('error, upper bits of destination unassigned')
-        if net.op == '*' and net.dests[0].bitwidth > 2 * net.args[0].bitwidth:
+        if op == '*' and net.dests[0].bitwidth > 2 * net.args[0].bitwidth:
             raise PyrtlInternalError('error, upper bits of destination unassigned')
-        if net.op == 'x' and net.dests[0].bitwidth > net.args[1].bitwidth:
+        if op == 'x' and net.dests[0].bitwidth > net.args[1].bitwidth:
             raise PyrtlInternalError('error, upper bits of mux output undefined')
-        if net.op == 'c' and net.dests[0].bitwidth > sum(x.bitwidth for x in net.args):
+        if op == 'c' and net.dests[0].bitwidth > sum(x.bitwidth for x in net.args):
             raise PyrtlInternalError('error, upper bits of concat output undefined')
-        if net.op == 's' and net.dests[0].bitwidth > len(net.op_param):
+        if op == 's' and net.dests[0].bitwidth > len(net.op_param):
             raise PyrtlInternalError('error, upper bits of select output undefined')
-        if net.op == 'm' and net.dests[0].bitwidth != net.op_param[1].bitwidth:
+        if op == 'm' and net.dests[0].bitwidth != net.op_param[1].bitwidth:
             raise PyrtlInternalError('error, mem read dest bitwidth mismatch')
-        if net.op == '@' and net.dests != ():
+        if op == '@' and net.dests != ():
             raise PyrtlInternalError('error, mem write dest should be empty tuple')
 
 
+# op classes used by Block.sanity_check_net, which runs on every net added
+_unary_ops = frozenset('w~rsm')
+_binary_ops = frozenset('&|^n+-*<>=')
+_mem_ops = frozenset('m@')
+_no_param_ops = frozenset('w~&|^n+-*<>=xcr')
+_bitwise_ops = frozenset('w~&|^nr')  # dest no wider than the first arg
+_compare_ops = frozenset('<>=')
+_addsub_ops = frozenset('+-')
+
+
+_net_check_type_cache = None
+
+
+def _net_check_types():
+    """ Return the (WireVector, Const, _MemReadBase) classes used when checking nets.
+
+    Both wire and memory import core, so these cannot be imported at the top of
+    this file.  Since every net added to a block is checked, the classes are
+    imported once here rather than with an import statement on each check.
+    """
+    global _net_check_type_cache
+    if _net_check_type_cache is None:
+        from .wire import WireVector, Const
+        from .memory import _MemReadBase
+        _net_check_type_cache = (WireVector, Const, _MemReadBase)
+    return _net_check_type_cache
+
+
 class PostSynthBlock(Block):
     """ This is a block with extra metadata required to maintain the
     pre synthesis interface post synthesis
@@ -676,6 +726,7 @@ _singleton_block = Block()
 debug_mode = False
 _setting_keep_wirevector_call_stack = False
 _setting_slower_but_more_descriptive_tmps = False
+_setting_const_interning = True
 
 
 def _get_useful_callpoint_name():
@@ -785,9 +836,11 @@ def set_debug_mode(debug=True):
     global debug_mode
     global _setting_keep_wirevector_call_stack
     global _setting_slower_but_more_descriptive_tmps
+    global _setting_const_interning
     debug_mode = debug
     _setting_keep_wirevector_call_stack = debug
     _setting_slower_but_more_descriptive_tmps = debug
+    _setting_const_interning = not debug  # each Const keeps its own call stack
 
 
 _py_regex = '^[^\d\W]\w*\Z'
@@ -797,16 +850,14 @@ class _NameIndexer(object):
     """ Provides internal names that are based on a prefix and an index"""
     def __init__(self, internal_prefix='_sani_temp'):
         self.internal_prefix = internal_prefix
-        self.internal_index = 0
+        self._counter = itertools.count()
 
     def make_valid_string(self):
         """Build a valid string based on the prefix and internal index"""
-        return self.internal_prefix + str(self.next_index())
+        return self.internal_prefix + str(next(self._counter))
 
     def next_index(self):
-        index = self.internal_index
-        self.internal_index += 1
-        return index
+        return next(self._counter)
 
 
 class _NameSanitizer(_NameIndexer):
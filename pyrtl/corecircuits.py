@@ -7,11 +7,14 @@ import math
 
 from .pyrtlexceptions import PyrtlError, PyrtlInternalError
 from .core import LogicNet, working_block
-from .wire import Const, WireVector
+from .wire import Const, WireVector, _interned_const, _bulk_bitwise_op
 from pyrtl.rtllib import barrel
 from pyrtl.rtllib import muxes
 from .conditional import otherwise
 
+# values as_wires turns into a Const (bool is included, as a subclass of int)
+_const_value_types = (int,) + six.string_types
+
 
 def mux(index, *mux_ins, **kwargs):
     """ Multiplexer returning the value of the wire in .
@@ -365,9 +368,9 @@ def as_wires(val, bitwidth=None, truncating=True, block=None):
     from .memory import _MemIndexed
     block = working_block(block)
 
-    if isinstance(val, (int, six.string_types)):
+    if isinstance(val, _const_value_types):
         # note that this case captures bool as well (as bools are instances of ints)
-        return Const(val, bitwidth=bitwidth, block=block)
+        return _interned_const(val, bitwidth=bitwidth, block=block)
     elif isinstance(val, _MemIndexed):
         # convert to a memory read when the value is actually used
         if val.wire is None:
@@ -502,7 +505,7 @@ def and_all_bits(vector):
     Takes a single WireVector and returns a 1 bit result, the bitwise and of all of
     the bits in the vector to a single bit.
     """
-    return tree_reduce(lambda a, b: a & b, vector)
+    return _bitwise_tree_reduce('&', vector)
 
 
 def or_all_bits(vector):
@@ -511,7 +514,7 @@ def or_all_bits(vector):
     Takes a single WireVector and returns a 1 bit result, the bitwise or of all of
     the bits in the vector to a single bit.
     """
-    return tree_reduce(lambda a, b: a | b, vector)
+    return _bitwise_tree_reduce('|', vector)
 
 
 def xor_all_bits(vector):
@@ -521,7 +524,7 @@ def xor_all_bits(vector):
     the bits in the vector to a single bit. This function is also aliased as `parity`
     and you can call it either way.
     """
-    return tree_reduce(lambda a, b: a ^ b, vector)
+    return _bitwise_tree_reduce('^', vector)
 
 
 parity = xor_all_bits  # shadowing the xor_all_bits_function
@@ -537,6 +540,32 @@ def tree_reduce(op, vector):
     return op(left, right)
 
 
+def _bitwise_tree_reduce(op, vector):
+    """ Reduce vector (a WireVector or a list of them) with the bitwise op in a tree.
+
+    Builds the same kind of tree as tree_reduce, but one whole level of the tree at
+    a time so that each level can be built with a single bulk operation.
+    """
+    if len(vector) < 1:
+        raise PyrtlError("Cannot reduce empty vectors")
+    if len(vector) == 1:
+        return vector[0]
+    if isinstance(vector, WireVector):
+        level = [vector[i] for i in range(len(vector))]
+    else:
+        level = [as_wires(v) for v in vector]
+
+    while len(level) > 1:
+        half = len(level) // 2
+        lefts, rights, leftover = level[:half], level[half:2 * half], level[2 * half:]
+        if len(set(w.bitwidth for w in lefts + rights)) == 1:
+            level = _bulk_bitwise_op(op, lefts, rights)
+        else:  # the normal operators will match the bitwidths
+            level = [a._two_var_op(b, op) for a, b in zip(lefts, rights)]
+        level.extend(leftover)
+    return level[0]
+
+
 def _apply_op_over_all_bits(op, vector):
     if len(vector) < 1:
         raise PyrtlError("Cannot reduce empty vectors")
@@ -6,6 +6,7 @@ from __future__ import print_function, unicode_literals
 import collections
 import math
 import numbers
+import re
 import six
 
 from .core import working_block, _NameIndexer
@@ -20,6 +21,7 @@ from .wire import WireVector, Input, Output, Const, Register
 
 
 probeIndexer = _NameIndexer('Probe-')
+_string_types = six.string_types
 
 
 def probe(w, name=None):
@@ -447,17 +449,25 @@ def infer_val_and_bitwidth(rawinput, bitwidth=None):
         infer_val_and_bitwidth("8'B 0110_1100") == (108, 8)
     """
 
-    if isinstance(rawinput, bool):
+    if type(rawinput) is int:  # the common case, skip the numbers.Integral ABC check
+        return _convert_int(rawinput, bitwidth)
+    elif isinstance(rawinput, bool):
         return _convert_bool(rawinput, bitwidth)
     elif isinstance(rawinput, numbers.Integral):
         return _convert_int(rawinput, bitwidth)
-    elif isinstance(rawinput, six.string_types):
+    elif isinstance(rawinput, _string_types):
         return _convert_verilog_str(rawinput, bitwidth)
     else:
         raise PyrtlError('error, the value provided is of an improper type, "%s"'
                          'proper types are bool, int, and string' % type(rawinput))
 
 
+# verilog-style constants: [-]<bitwidth>'[s][base]<digits>, e.g. "8'hff" or "-5'b11";
+# the digits themselves are validated by int() for the chosen base
+_verilog_const_regex = re.compile(r"(-)?(\d+)'([sS])?([bodhxBODHX])?([0-9a-zA-Z_\s]+)$")
+_verilog_bases = {'b': 2, 'o': 8, 'd': 10, 'h': 16, 'x': 16}
+
+
 def _convert_bool(bool_val, bitwidth=None):
     num = int(bool_val)
     if bitwidth is None:
@@ -472,7 +482,7 @@ def _convert_int(val, bitwidth=None):
         num = val
         # infer bitwidth if it is not specified explicitly
         if bitwidth is None:
-            bitwidth = len(bin(num)) - 2  # the -2 for the "0b" at the start of the string
+            bitwidth = max(int(num).bit_length(), 1)  # Const(0) still needs 1 bit
     else:  # val is negative
         if bitwidth is None:
             raise PyrtlError(
@@ -484,28 +494,18 @@ def _convert_int(val, bitwidth=None):
 
 
 def _convert_verilog_str(val, bitwidth=None):
-    bases = {'b': 2, 'o': 8, 'd': 10, 'h': 16, 'x': 16}
-    passed_bitwidth = bitwidth
-
-    neg = False
-    if val.startswith('-'):
-        neg = True
-        val = val[1:]
-    split_string = val.lower().split("'")
-    if len(split_string) != 2:
+    match = _verilog_const_regex.match(val)
+    if match is None:
         raise PyrtlError('error, string not in verilog style format')
+    neg, width_str, signed, base_char, sval = match.groups()
+    if signed:
+        raise PyrtlError('error, signed integers are not supported in verilog-style constants')
+    passed_bitwidth = bitwidth
+    bitwidth = int(width_str)
+    base = _verilog_bases[base_char.lower()] if base_char else 10
     try:
-        bitwidth = int(split_string[0])
-        sval = split_string[1]
-        if sval[0] == 's':
-            raise PyrtlError('error, signed integers are not supported in verilog-style constants')
-        base = 10
-        if sval[0] in bases:
-            base = bases[sval[0]]
-            sval = sval[1:]
-        sval = sval.replace('_', '')
-        num = int(sval, base)
-    except (IndexError, ValueError):
+        num = int(sval.replace('_', ''), base)
+    except ValueError:
         raise PyrtlError('error, string not in verilog style format')
     if neg and num:
         if (num >> bitwidth-1):
@@ -243,7 +243,7 @@ def _find_common_subexps(block):
             new_args = tuple(_const_to_int(w, const_dict) for w in net.args)
         else:
             new_args = tuple(sorted((_const_to_int(w, const_dict) for w in net.args), key=hash))
-        net_sub = LogicNet(net[0], net[1], new_args, t)  # don't care about dests
+        net_sub = LogicNet(net.op, net.op_param, new_args, t)  # don't care about dests
         if net_sub in net_table:
             net_table[net_sub].append(net)
         else:
@@ -15,12 +15,16 @@ from __future__ import print_function, unicode_literals
 import numbers
 import six
 import re
+import sys
+import traceback
 
 from . import core  # needed for _setting_keep_wirevector_call_stack
 
 from .pyrtlexceptions import PyrtlError, PyrtlInternalError
 from .core import working_block, LogicNet, _NameIndexer
 
+_string_types = six.string_types  # (str,) on Python 3, bound once for the name checks
+
 # ----------------------------------------------------------------
 #        ___  __  ___  __   __
 #  \  / |__  /  `  |  /  \ |__)
@@ -31,6 +35,12 @@ from .core import working_block, LogicNet, _NameIndexer
 _wvIndexer = _NameIndexer("tmp")
 _constIndexer = _NameIndexer("const_")
 
+# used by next_tempvar_name to strip non alphanumeric characters out of the
+# (frequently repeated) caller filenames, memoized since the set of files is small
+_nonword_regex = re.compile(r'\W+')
+_safename_cache = {}
+_safename_cache_limit = 4096
+
 
 def next_tempvar_name(name=""):
     if name == '':  # sadly regex checks are sometimes too slow
@@ -38,7 +48,12 @@ def next_tempvar_name(name=""):
         callpoint = core._get_useful_callpoint_name()
         if callpoint:  # returns none if debug mode is false
             filename, lineno = callpoint
-            safename = re.sub('[\W]+', '', filename)  # strip out non alphanumeric characters
+            safename = _safename_cache.get(filename)
+            if safename is None:
+                if len(_safename_cache) > _safename_cache_limit:
+                    _safename_cache.clear()
+                safename = _nonword_regex.sub('', filename)
+                _safename_cache[filename] = safename
             wire_name += '_%s_line%d' % (safename, lineno)
         return wire_name
     else:
@@ -90,6 +105,12 @@ class WireVector(object):
     # Each class inheriting from WireVector should overload accordingly
     _code = 'W'
 
+    # Slots keep the per-wire footprint small for large designs.  '__dict__' is
+    # kept so that users can still attach their own custom properties to wires
+    # (it is only allocated when such a property is actually set).
+    __slots__ = ('_name', '_block', 'bitwidth', '_bitmask', '_init_call_stack',
+                 '__dict__')
+
     def __init__(self, bitwidth=None, name='', block=None):
         """ Construct a generic WireVector
 
@@ -101,16 +122,31 @@ class WireVector(object):
          Must be unique. If none is provided, one will be autogenerated
         :return: a wirevector object representing a const wire
         """
-        self._name = None
-
         # used only to verify the one to one relationship of wires and blocks
         self._block = working_block(block)
-        self.name = next_tempvar_name(name)
+
+        # a new wire has no old name to remove from the block, so rather than
+        # going through the name setter it is registered with the block directly
+        name = next_tempvar_name(name)
+        if not isinstance(name, _string_types):
+            raise PyrtlError('WireVector names must be strings')
+        self._name = name
+        self._block.wirevector_set.add(self)
+        self._block.wirevector_by_name[name] = self
         self._validate_bitwidth(bitwidth)
 
         if core._setting_keep_wirevector_call_stack:
-            import traceback
-            self.init_call_stack = traceback.format_stack()
+            # only capture the frames here, formatting them is left until they are needed
+            self._init_call_stack = traceback.StackSummary.extract(
+                traceback.walk_stack(sys._getframe()), lookup_lines=False)
+
+    @property
+    def init_call_stack(self):
+        """ The call stack (a list of strings, like traceback.format_stack) at the point
+        this WireVector was created.  Only recorded when in debug mode (see
+        set_debug_mode), otherwise accessing it raises an AttributeError."""
+        stack = self._init_call_stack
+        return traceback.StackSummary.from_list(reversed(stack)).format()
 
     @property
     def name(self):
@@ -120,14 +156,15 @@ class WireVector(object):
 
     @name.setter
     def name(self, value):
-        if not isinstance(value, six.string_types):
+        if not isinstance(value, _string_types):
             raise PyrtlError('WireVector names must be strings')
         self._block.wirevector_by_name.pop(self._name, None)
         self._name = value
         self._block.add_wirevector(self)
 
-    def __hash__(self):
-        return id(self)
+    # wires hash on their identity; using object's C-level hash directly avoids a
+    # Python function call on every set/dict operation (__eq__ builds hardware)
+    __hash__ = object.__hash__
 
     def __str__(self):
         """ A string representation of the wire in 'name/bitwidth code' form. """
@@ -135,7 +172,8 @@ class WireVector(object):
 
     def _validate_bitwidth(self, bitwidth):
         if bitwidth is not None:
-            if not isinstance(bitwidth, numbers.Integral):
+            # "type() is int" is the common case and skips the slower numbers.Integral check
+            if type(bitwidth) is not int and not isinstance(bitwidth, numbers.Integral):
                 raise PyrtlError('bitwidth must be from type int or unspecified, instead "%s"'
                                  ' was passed of type %s' % (str(bitwidth), type(bitwidth)))
             elif bitwidth == 0:
@@ -143,23 +181,20 @@ class WireVector(object):
             elif bitwidth < 0:
                 raise PyrtlError('you are trying a negative bitwidth? awesome but wrong')
         self.bitwidth = bitwidth
+        self._bitmask = None if bitwidth is None else (1 << bitwidth) - 1
 
     def _build(self, other):
         # Actually create and add wirevector to logic block
         # This might be called immediately from ilshift, or delayed from conditional assignment
-        net = LogicNet(
-            op='w',
-            op_param=None,
-            args=(other,),
-            dests=(self,))
-        working_block().add_net(net)
+        net = LogicNet('w', None, (other,), (self,))
+        self._block.add_net(net)
 
     def _prepare_for_assignment(self, rhs):
         # Convert right-hand-side to wires and propagate bitwidth if necessary
-        from .corecircuits import as_wires
-        rhs = as_wires(rhs, bitwidth=self.bitwidth)
+        rhs = _as_wires(rhs, bitwidth=self.bitwidth)
         if self.bitwidth is None:
             self.bitwidth = rhs.bitwidth
+            self._bitmask = (1 << self.bitwidth) - 1
         return rhs
 
     def __ilshift__(self, other):
@@ -184,12 +219,15 @@ class WireVector(object):
     def _two_var_op(self, other, op):
         #is called in each overloaded operator's function
         #this function will
-        from .corecircuits import as_wires, match_bitwidth
-
-        # convert constants if necessary
-        a, b = self, as_wires(other)
-        a, b = match_bitwidth(a, b)
-        resultlen = len(a)  # both are the same length now
+        if (type(other) in _plain_wire_types and other.bitwidth == self.bitwidth
+                and self.bitwidth is not None):
+            # the common case, two wires of the same width: nothing to convert or extend
+            a, b = self, other
+        else:
+            # convert constants if necessary
+            a, b = self, _as_wires(other)
+            a, b = _match_bitwidth(a, b)
+        resultlen = a.bitwidth  # both are the same length now
 
         # some operations actually create more or less bits
         if op in '+-':
@@ -200,12 +238,8 @@ class WireVector(object):
             resultlen = 1
 
         s = WireVector(bitwidth=resultlen)
-        net = LogicNet(
-            op=op,
-            op_param=None,
-            args=(a, b),
-            dests=(s,))
-        working_block().add_net(net)
+        net = LogicNet(op, None, (a, b), (s,))
+        self._block.add_net(net)
         return s
 
     def __bool__(self):
@@ -282,8 +316,7 @@ class WireVector(object):
         return self._two_var_op(other, '-')
 
     def __rsub__(self, other):
-        from .corecircuits import as_wires
-        other = as_wires(other)  # '-' op is not symmetric
+        other = _as_wires(other)  # '-' op is not symmetric
         return other._two_var_op(self, '-')
 
     def __isub__(self, other):
@@ -349,12 +382,8 @@ class WireVector(object):
         :return Wirevector: a result wire for the operation
         """
         outwire = WireVector(bitwidth=len(self))
-        net = LogicNet(
-            op='~',
-            op_param=None,
-            args=(self,),
-            dests=(outwire,))
-        working_block().add_net(net)
+        net = LogicNet('~', None, (self,), (outwire,))
+        self._block.add_net(net)
         return outwire
 
     def __getitem__(self, item):
@@ -363,20 +392,23 @@ class WireVector(object):
         """
         if self.bitwidth is None:
             raise PyrtlError('You cannot get a subset of a wire with no bitwidth')
-        allindex = range(self.bitwidth)
         if isinstance(item, int):
-            selectednums = (allindex[item], )  # this method handles negative numbers correctly
-        else:  # slice
-            selectednums = tuple(allindex[item])
+            index = int(item)  # so a bool index is stored as a plain int
+            if index < 0:
+                index += self.bitwidth
+            if not 0 <= index < self.bitwidth:
+                raise IndexError('index %d out of range for wire of bitwidth %d'
+                                 % (item, self.bitwidth))
+            selectednums = (index, )
+        elif isinstance(item, slice):
+            selectednums = tuple(range(*item.indices(self.bitwidth)))
+        else:
+            selectednums = tuple(range(self.bitwidth)[item])
         if not selectednums:
             raise PyrtlError('selection %s must have at least select one wire' % str(item))
         outwire = WireVector(bitwidth=len(selectednums))
-        net = LogicNet(
-            op='s',
-            op_param=selectednums,
-            args=(self,),
-            dests=(outwire,))
-        working_block().add_net(net)
+        net = LogicNet('s', selectednums, (self,), (outwire,))
+        self._block.add_net(net)
         return outwire
 
     def __lshift__(self, other):
@@ -432,6 +464,37 @@ class WireVector(object):
         """
         return self._two_var_op(other, 'n')
 
+    def bulk_binop(self, op, others):
+        """ Creates the LogicNets for a bitwise op between self and each of others at once.
+
+        :param op: the bitwise operation, one of '&', '|', '^', or 'n' (nand)
+        :param others: WireVectors (or values such as ints that can be converted
+          to Consts) each with the same bitwidth as self
+        :return list: a list of WireVectors, the result of "self op other" for each other
+
+        This builds the same hardware as `[self & o for o in others]` (for op '&') but
+        the operands are converted and checked once for the whole batch and the nets
+        are added to the block together, which is much faster for wide generators.
+        Unlike the normal operators, the bitwidths are not matched for you and a
+        PyrtlError is raised if they differ.
+        """
+        others = [_as_wires(o) if isinstance(o, WireVector)
+                  else _as_wires(o, bitwidth=self.bitwidth)
+                  for o in others]
+        return _bulk_bitwise_op(op, [self] * len(others), others)
+
+    def and_many(self, others):
+        """ Returns a list of WireVectors, self & other for each of others (see bulk_binop). """
+        return self.bulk_binop('&', others)
+
+    def or_many(self, others):
+        """ Returns a list of WireVectors, self | other for each of others (see bulk_binop). """
+        return self.bulk_binop('|', others)
+
+    def xor_many(self, others):
+        """ Returns a list of WireVectors, self ^ other for each of others (see bulk_binop). """
+        return self.bulk_binop('^', others)
+
     @property
     def bitmask(self):
         """ A property holding a bitmask of the same length as this WireVector.
@@ -442,9 +505,16 @@ class WireVector(object):
         the number of bits of a WireVector.  As a convenience for this, the
         `bitmask` property is provided.  As an example, if there was a 3-bit
         WireVector `a`, a call to  `a.bitmask()` should return 0b111 or 0x7."""
-        if "_bitmask" not in self.__dict__:
-            self._bitmask = (1 << len(self)) - 1
-        return self._bitmask
+        # normally filled in whenever the bitwidth is set, but recomputed if the
+        # bitwidth was assigned directly or WireVector.__init__ never ran
+        try:
+            mask = self._bitmask
+            if mask is not None and mask.bit_length() == self.bitwidth:
+                return mask
+        except AttributeError:
+            pass
+        self._bitmask = mask = (1 << len(self)) - 1
+        return mask
 
     def truncate(self, bitwidth):
         """ Generate a new truncated wirevector derived from self.
@@ -492,17 +562,50 @@ class WireVector(object):
                 'Neither zero_extended nor sign_extended can'
                 ' reduce the number of bits')
         else:
-            from .corecircuits import concat
             if isinstance(extbit, int):
-                extbit = Const(extbit, bitwidth=1)
+                extbit = _interned_const(extbit, bitwidth=1)
             extvector = WireVector(bitwidth=numext)
-            net = LogicNet(
-                op='s',
-                op_param=(0,)*numext,
-                args=(extbit,),
-                dests=(extvector,))
-            working_block().add_net(net)
-            return concat(extvector, self)
+            net = LogicNet('s', (0,)*numext, (extbit,), (extvector,))
+            self._block.add_net(net)
+            return _concat(extvector, self)
+
+
+def _bulk_bitwise_op(op, lefts, rights):
+    """ Build the nets "lefts[i] op rights[i]" for same-width wires, returning the results.
+
+    Rather than going through Block.add_net for each net, the operands are
+    checked once up front and then all of the (by construction valid) nets are
+    added to the block together.
+    """
+    if op not in ('&', '|', '^', 'n'):
+        raise PyrtlError('error, bulk operations only support the bitwise ops &, |, ^, and n')
+    if len(lefts) != len(rights):
+        raise PyrtlError('error, bulk operations need the same number of left and right operands')
+    if not lefts:
+        return []
+
+    block = lefts[0]._block
+    bitwidth = lefts[0].bitwidth
+    if bitwidth is None:
+        raise PyrtlError('error, attempting to use wirevector with no defined bitwidth')
+    if op not in block.legal_ops:
+        raise PyrtlInternalError('error, net op "%s" not from acceptable set %s'
+                                 % (op, block.legal_ops))
+    for w in set(lefts).union(rights):
+        block.sanity_check_wirevector(w)
+        if w._block is not block:
+            raise PyrtlInternalError('error, net references different block')
+        if w not in block.wirevector_set:
+            raise PyrtlInternalError('error, net with unknown source "%s"' % w.name)
+        if w.bitwidth != bitwidth:
+            raise PyrtlError('error, bulk operations require all operands to have the same '
+                             'bitwidth, but "%s" has bitwidth %s instead of %d'
+                             % (w.name, w.bitwidth, bitwidth))
+
+    results = [WireVector(bitwidth=bitwidth, block=block) for _ in lefts]
+    block.logic.update(LogicNet(op, None, (a, b), (s,))
+                       for a, b, s in zip(lefts, rights, results))
+    return results
 
 
 # -----------------------------------------------------------------------
@@ -514,6 +617,7 @@ class WireVector(object):
 class Input(WireVector):
     """ A WireVector type denoting inputs to a block (no writers) """
     _code = 'I'
+    __slots__ = ('is_assigned',)
 
     def __init__(self, bitwidth=None, name='', block=None):
         #super(Input, self).__init__(bitwidth=bitwidth, name=name, block=block) #syntax in Python 2.x
@@ -547,6 +651,7 @@ class Output(WireVector):
     them will throw an error.
     """
     _code = 'O'
+    __slots__ = ()
 
     def __init__(self, bitwidth=None, name='', block=None):
         # super(Output, self).__init__(bitwidth, name, block) # syntax in Python 2.x
@@ -563,6 +668,7 @@ class Const(WireVector):
     to a two's complement representation of the specified bitwidth."""
 
     _code = 'C'
+    __slots__ = ('signed', 'val', '__weakref__')
 
     def __init__(self, val, bitwidth=None, block=None):
         """ Construct a constant implementation at initialization
@@ -574,7 +680,10 @@ class Const(WireVector):
         py:method:: WireVector.__init__()
         """
         self.signed = True if val < 0 else False
-        self._validate_bitwidth(bitwidth)
+        if bitwidth is not None:
+            # an inferred bitwidth is always valid; a given one must be checked
+            # before it is used below to test that the value fits
+            self._validate_bitwidth(bitwidth)
         from .helperfuncs import infer_val_and_bitwidth
         num, bitwidth = infer_val_and_bitwidth(val, bitwidth)
 
@@ -592,6 +701,14 @@ class Const(WireVector):
         # add the member "val" to track the value of the constant
         self.val = num
 
+    @WireVector.name.setter
+    def name(self, value):
+        WireVector.name.fset(self, value)
+        # a renamed Const is no longer anonymous, so it must not be shared any more
+        intern = self._block._const_intern
+        for key in [k for k, c in intern.items() if c is self]:
+            del intern[key]
+
     def __ilshift__(self, other):
         """ This is an illegal op for Consts. Their value is set in the __init__ function"""
         raise PyrtlError(
@@ -607,6 +724,32 @@ class Const(WireVector):
             % str(self.name))
 
 
+def _const_intern_key(val, bitwidth):
+    """ Key under which a Const built from (val, bitwidth) is interned, or None. """
+    if type(val) in (int, bool) and (bitwidth is None or type(bitwidth) is int):
+        return val, bitwidth, type(val)
+    return None
+
+
+def _interned_const(val, bitwidth=None, block=None):
+    """ Return an anonymous Const for val, shared with earlier requests in the block.
+
+    The same small constants (0, 1, ...) are created over and over when building
+    hardware, so the constants PyRTL makes internally (extension bits, values
+    converted by as_wires) reuse a Const built from the same arguments.  A Const
+    made directly with Const() is always a new wire.
+    """
+    key = _const_intern_key(val, bitwidth) if core._setting_const_interning else None
+    if key is None:
+        return Const(val, bitwidth=bitwidth, block=block)
+    block = working_block(block)
+    const = block._const_intern.get(key)
+    if const is None or const not in block.wirevector_set:
+        const = Const(val, bitwidth=bitwidth, block=block)
+        block._const_intern[key] = const
+    return const
+
+
 class Register(WireVector):
     """ A WireVector with a register state element embedded.
 
@@ -618,6 +761,7 @@ class Register(WireVector):
     to specify a counter it would look like: "a.next <<= a + 1"
     """
     _code = 'R'
+    __slots__ = ('reg_in',)
 
     # When the register is called as such:  r.next <<= foo
     # the sequence of actions that happens is:
@@ -633,6 +777,7 @@ class Register(WireVector):
 
     class _Next(object):
         """ This is the type returned by "r.next". """
+        __slots__ = ('reg',)
 
         def __init__(self, reg):
             self.reg = reg
@@ -654,6 +799,7 @@ class Register(WireVector):
 
     class _NextSetter(object):
         """ This is the type returned by __ilshift__ which r.next will be assigned. """
+        __slots__ = ('rhs', 'is_conditional')
 
         def __init__(self, rhs, is_conditional):
             self.rhs = rhs
@@ -678,15 +824,14 @@ class Register(WireVector):
         raise PyrtlError('error, you cannot set registers directly, net .next instead')
 
     def _next_ilshift(self, other):
-        from .corecircuits import as_wires
-        other = as_wires(other, bitwidth=self.bitwidth)
+        other = _as_wires(other, bitwidth=self.bitwidth)
         if self.bitwidth is None:
             self.bitwidth = other.bitwidth
+            self._bitmask = (1 << self.bitwidth) - 1
         return Register._NextSetter(other, is_conditional=False)
 
     def _next_ior(self, other):
-        from .corecircuits import as_wires
-        other = as_wires(other, bitwidth=self.bitwidth)
+        other = _as_wires(other, bitwidth=self.bitwidth)
         if not self.bitwidth:
             raise PyrtlError('Conditional assignment only defined on '
                              'Registers with pre-defined bitwidths')
@@ -708,5 +853,16 @@ class Register(WireVector):
         # this actually builds the register which might be from directly setting
         # the property "next" or delayed when there is a conditional assignement
         self.reg_in = next
-        net = LogicNet('r', None, args=(self.reg_in,), dests=(self,))
-        working_block().add_net(net)
+        net = LogicNet('r', None, (self.reg_in,), (self,))
+        self._block.add_net(net)
+
+
+# wire types whose operands can skip as_wires/match_bitwidth in _two_var_op
+# when their bitwidths already match (i.e. not _MemIndexed or user subclasses)
+_plain_wire_types = (WireVector, Input, Output, Const, Register)
+
+
+# corecircuits imports this module, so its helpers are bound here, after the
+# classes above exist, rather than being re-imported on every operator call
+from .corecircuits import as_wires as _as_wires, match_bitwidth as _match_bitwidth  # noqa: E402
+from .corecircuits import concat as _concat  # noqa: E402
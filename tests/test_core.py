@@ -501,6 +501,11 @@ class TestLogicNets(unittest.TestCase):
     def test_net_with_wirevectors(self):
         pass
 
+    def test_unpacking(self):
+        net = pyrtl.LogicNet('+', 'xx', ("arg1", "arg2"), ("dest",))
+        op, op_param, args, dests = net
+        self.assertEqual((op, op_param, args, dests), ('+', 'xx', ("arg1", "arg2"), ("dest",)))
+
     def test_memory_read_print(self):
         pass
 
@@ -112,6 +112,13 @@ class TestNonCoreHelpers(unittest.TestCase):
         self.assertEqual(pyrtl.infer_val_and_bitwidth("5'b10"), (2, 5))
         self.assertEqual(pyrtl.infer_val_and_bitwidth("5'b10"), (2, 5))
         self.assertEqual(pyrtl.infer_val_and_bitwidth("8'B 0110_1100"), (108, 8))
+        self.assertEqual(pyrtl.infer_val_and_bitwidth("16'hFF"), (255, 16))
+        self.assertEqual(pyrtl.infer_val_and_bitwidth("-5'b11"), (29, 5))
+
+    def test_infer_val_and_bitwidth_bad_strings(self):
+        for bad in ("5'sb11", "5'-3", "5", "'1", "5'", "5'b12"):
+            with self.assertRaises(pyrtl.PyrtlError):
+                pyrtl.infer_val_and_bitwidth(bad)
 
 class TestBitField_Update(unittest.TestCase):
     def setUp(self):
@@ -273,6 +280,25 @@ class TestXorAllBits(unittest.TestCase):
         expected = [v1 ^ v2 ^ v3 ^ v4 for v1, v2, v3, v4 in zip(*vals)]
         self.assertEqual(expected, utils.sim_and_ret_out(out, in_wires, vals))
 
+    def mixed_width_inputs(self):
+        wires_and_vals = [utils.an_input_and_vals(b, name='in%d' % i)
+                          for i, b in enumerate([3, 7, 1, 5, 4])]
+        return [w for w, v in wires_and_vals], [v for w, v in wires_and_vals]
+
+    def test_list_of_mixed_width_wires(self):
+        in_wires, vals = self.mixed_width_inputs()
+        out = pyrtl.Output(name='o')
+        out <<= pyrtl.corecircuits.xor_all_bits(in_wires)
+        expected = [v1 ^ v2 ^ v3 ^ v4 ^ v5 for v1, v2, v3, v4, v5 in zip(*vals)]
+        self.assertEqual(expected, utils.sim_and_ret_out(out, in_wires, vals))
+
+    def test_and_all_bits_of_mixed_width_wires(self):
+        in_wires, vals = self.mixed_width_inputs()
+        out = pyrtl.Output(name='o')
+        out <<= pyrtl.corecircuits.and_all_bits(in_wires)
+        expected = [v1 & v2 & v3 & v4 & v5 for v1, v2, v3, v4, v5 in zip(*vals)]
+        self.assertEqual(expected, utils.sim_and_ret_out(out, in_wires, vals))
+
 
 class TestMux(unittest.TestCase):
     def setUp(self):
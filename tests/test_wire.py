@@ -50,6 +50,67 @@ class TestWireVector(unittest.TestCase):
         self.assertIn("testJohn", block.wirevector_by_name)
         self.assertIn(w, block.wirevector_set)
 
+    def test_bitmask(self):
+        self.assertEqual(pyrtl.WireVector(5).bitmask, 0b11111)
+        w = pyrtl.WireVector()
+        with self.assertRaises(pyrtl.PyrtlError):
+            w.bitmask
+        w <<= pyrtl.Input(3)
+        self.assertEqual(w.bitmask, 0b111)
+        r = pyrtl.Register(None)
+        r.next <<= pyrtl.Input(2)
+        self.assertEqual(r.bitmask, 0b11)
+
+    def test_bitmask_after_bitwidth_assignment(self):
+        i = pyrtl.Input(None, 'i')
+        i.bitwidth = 4
+        self.assertEqual(i.bitmask, 0b1111)
+        o = pyrtl.Output(None, 'o')
+        o <<= i
+        self.assertEqual(o.bitmask, 0b1111)
+        o.bitwidth = 2
+        self.assertEqual(o.bitmask, 0b11)
+
+    def test_custom_properties(self):
+        w = pyrtl.WireVector(3, "test1")
+        w.my_custom_property = 13
+        self.assertEqual(w.my_custom_property, 13)
+        self.assertEqual(w.bitmask, 0b111)
+        r = pyrtl.Register(3)
+        with self.assertRaises(AttributeError):
+            r.next.my_custom_property = 13
+
+
+class TestBulkOperations(unittest.TestCase):
+    def setUp(self):
+        pyrtl.reset_working_block()
+
+    def test_xor_many(self):
+        a = pyrtl.Input(4, 'a')
+        others = [pyrtl.Input(4, 'b%d' % i) for i in range(3)] + [5]
+        results = a.xor_many(others)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(len(r) == 4 for r in results))
+        xor_nets = pyrtl.working_block().logic_subset('^')
+        self.assertEqual(len(xor_nets), 4)
+        self.assertEqual(set(net.dests[0] for net in xor_nets), set(results))
+        for i, r in enumerate(results):
+            o = pyrtl.Output(4, 'o%d' % i)
+            o <<= r
+        pyrtl.working_block().sanity_check()
+
+    def test_bulk_binop_bitwidth_mismatch(self):
+        a = pyrtl.WireVector(4)
+        b = pyrtl.WireVector(3)
+        with self.assertRaises(pyrtl.PyrtlError):
+            a.and_many([b])
+
+    def test_bulk_binop_bad_op(self):
+        a = pyrtl.WireVector(4)
+        b = pyrtl.WireVector(4)
+        with self.assertRaises(pyrtl.PyrtlError):
+            a.bulk_binop('+', [b])
+
 
 class TestWireVectorNames(unittest.TestCase):
     def is_valid_str(self, s):
@@ -159,6 +220,13 @@ class TestWirevectorSlicing(unittest.TestCase):
         self.valid_slice(8, slice(-6, -2, 3))
         pyrtl.working_block().sanity_check()
 
+    def test_bool_index(self):
+        w = pyrtl.Input(4)
+        x = w[True]
+        net, = pyrtl.working_block().logic_subset('s')
+        self.assertEqual(net.op_param, (1,))
+        self.assertIs(type(net.op_param[0]), int)
+
     def test_invalid_indicies(self):
         self.invalid_slice_index(4, 5)
         self.invalid_slice_index(4, -5)
@@ -295,6 +363,11 @@ class TestConst(unittest.TestCase):
         self.assert_bad_const(False, bitwidth=2)
         self.assert_bad_const(True, bitwidth=0)
 
+    def test_badbitwidth(self):
+        self.assert_bad_const(1, bitwidth=0)
+        self.assert_bad_const(1, bitwidth=-1)
+        self.assert_bad_const(1, bitwidth='happy')
+
     def test_badtype(self):
         self.assert_bad_const(pyrtl.Const(123))
         self.assert_bad_const([])
@@ -304,6 +377,42 @@ class TestConst(unittest.TestCase):
             c = pyrtl.Const(4)
             c <<= 3
 
+    def test_const_is_not_interned(self):
+        a = pyrtl.Const(0, bitwidth=4)
+        a.note = 'x'
+        b = pyrtl.Const(0, bitwidth=4)
+        self.assertIsNot(a, b)
+        self.assertFalse(hasattr(b, 'note'))
+
+    def test_interning(self):
+        c = pyrtl.as_wires(1, bitwidth=3)
+        self.assertIs(pyrtl.as_wires(1, bitwidth=3), c)
+        self.assertIsNot(pyrtl.as_wires(1, bitwidth=4), c)
+        self.assertIsNot(pyrtl.as_wires(True), pyrtl.as_wires(1))
+        self.assertIsNot(pyrtl.as_wires(-1, bitwidth=3), pyrtl.as_wires(7, bitwidth=3))
+
+    def test_interning_removed_const(self):
+        c = pyrtl.as_wires(5)
+        pyrtl.working_block().remove_wirevector(c)
+        d = pyrtl.as_wires(5)
+        self.assertIsNot(d, c)
+        self.assertIn(d, pyrtl.working_block().wirevector_set)
+
+    def test_interning_renamed_const(self):
+        c = pyrtl.as_wires(5)
+        c.name = 'five'
+        d = pyrtl.as_wires(5)
+        self.assertIsNot(d, c)
+        self.assertEqual(c.name, 'five')
+        self.assertIs(pyrtl.as_wires(5), d)
+
+    def test_no_interning_in_debug_mode(self):
+        pyrtl.set_debug_mode(True)
+        try:
+            self.assertIsNot(pyrtl.as_wires(5), pyrtl.as_wires(5))
+        finally:
+            pyrtl.set_debug_mode(False)
+
     def check_const(self, val_in, expected_val, expected_bitwidth, **kargs):
         c = pyrtl.Const(val_in, **kargs)
         self.assertEqual(c.val, expected_val)